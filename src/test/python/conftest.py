@@ -0,0 +1,13 @@
+"""
+pytest configuration for the bridge_mcp_ghidra tests.
+
+Makes this directory importable under every pytest import mode and installs
+the mcp stubs once, before any test module is collected.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import mcp_stubs  # noqa: E402,F401
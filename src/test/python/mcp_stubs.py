@@ -0,0 +1,37 @@
+"""
+Test support for bridge_mcp_ghidra.
+
+Importing this module stubs the mcp package and puts the repository root on
+sys.path, so bridge_mcp_ghidra can be imported without the real dependency.
+"""
+
+import importlib.machinery
+import importlib.util
+import os
+import sys
+
+# Add the repository root to the path to import the module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+
+def _ghost_module(name, is_package=False):
+    """Create an empty module with a real __spec__, without importing anything"""
+    spec = importlib.machinery.ModuleSpec(name, None, is_package=is_package)
+    return importlib.util.module_from_spec(spec)
+
+
+def _tool():
+    """Pass-through replacement for FastMCP.tool()"""
+    return lambda f: f
+
+
+# Stub the mcp package before importing bridge_mcp_ghidra. Ghost modules avoid
+# both the mcp dependency and MagicMock's attribute and call bookkeeping on
+# every @mcp.tool() at import.
+mcp_mod = _ghost_module('mcp', is_package=True)
+mcp_mod.tool = _tool
+fastmcp_mod = _ghost_module('mcp.server.fastmcp')
+fastmcp_mod.FastMCP = lambda name: mcp_mod
+sys.modules['mcp'] = mcp_mod
+sys.modules['mcp.server'] = _ghost_module('mcp.server', is_package=True)
+sys.modules['mcp.server.fastmcp'] = fastmcp_mod